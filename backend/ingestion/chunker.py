@@ -8,7 +8,53 @@ import uuid
 from loguru import logger
 
 
-@dataclass
+# Canonical Old Testament books, built once at import for O(1) membership checks
+OLD_TESTAMENT_BOOKS = frozenset(
+    {
+        "Genesis",
+        "Exodus",
+        "Leviticus",
+        "Numbers",
+        "Deuteronomy",
+        "Joshua",
+        "Judges",
+        "Ruth",
+        "1 Samuel",
+        "2 Samuel",
+        "1 Kings",
+        "2 Kings",
+        "1 Chronicles",
+        "2 Chronicles",
+        "Ezra",
+        "Nehemiah",
+        "Esther",
+        "Job",
+        "Psalms",
+        "Proverbs",
+        "Ecclesiastes",
+        "Song of Solomon",
+        "Isaiah",
+        "Jeremiah",
+        "Lamentations",
+        "Ezekiel",
+        "Daniel",
+        "Hosea",
+        "Joel",
+        "Amos",
+        "Obadiah",
+        "Jonah",
+        "Micah",
+        "Nahum",
+        "Habakkuk",
+        "Zephaniah",
+        "Haggai",
+        "Zechariah",
+        "Malachi",
+    }
+)
+
+
+@dataclass(slots=True)
 class UnifiedChunk:
     """Chunk model supporting both biblical and general document context."""
 
@@ -49,48 +95,7 @@ class UnifiedChunk:
             )
 
     def _is_old_testament(self) -> bool:
-        ot_books = {
-            "Genesis",
-            "Exodus",
-            "Leviticus",
-            "Numbers",
-            "Deuteronomy",
-            "Joshua",
-            "Judges",
-            "Ruth",
-            "1 Samuel",
-            "2 Samuel",
-            "1 Kings",
-            "2 Kings",
-            "1 Chronicles",
-            "2 Chronicles",
-            "Ezra",
-            "Nehemiah",
-            "Esther",
-            "Job",
-            "Psalms",
-            "Proverbs",
-            "Ecclesiastes",
-            "Song of Solomon",
-            "Isaiah",
-            "Jeremiah",
-            "Lamentations",
-            "Ezekiel",
-            "Daniel",
-            "Hosea",
-            "Joel",
-            "Amos",
-            "Obadiah",
-            "Jonah",
-            "Micah",
-            "Nahum",
-            "Habakkuk",
-            "Zephaniah",
-            "Haggai",
-            "Zechariah",
-            "Malachi",
-        }
-        return self.book in ot_books if self.book else False
+        return self.book in OLD_TESTAMENT_BOOKS if self.book else False
 
 
 import os
@@ -130,7 +135,7 @@ class ChunkingConfig:
 
 
 # Unified chunk object for all chunkers
-@dataclass
+@dataclass(slots=True)
 class ChunkObject:
     content: str
     index: int
@@ -5,9 +5,11 @@ Strictly uses only present modules and agentic logic. No Milvus or big tech depe
 
 import os
 import asyncio
+import cProfile
 import logging
 import json
-import glob
+import pstats
+import textwrap
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -40,6 +42,9 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for chunks without extracted entities
+_NO_ENTITIES: Dict[str, List[str]] = {}
+
 
 class DocumentIngestionPipeline:
     """
@@ -141,8 +146,10 @@ class DocumentIngestionPipeline:
                     )
                 )
         # Log summary
-        total_chunks = sum(r.chunks_created for r in results)
-        total_errors = sum(len(r.errors) for r in results)
+        total_chunks = total_errors = 0
+        for result in results:
+            total_chunks += result.chunks_created
+            total_errors += len(result.errors)
         logger.info(
             f"Ingestion complete: {len(results)} documents, {total_chunks} chunks, {total_errors} errors"
         )
@@ -185,12 +192,13 @@ class DocumentIngestionPipeline:
         if self.config.extract_entities:
             chunks = await self.graph_builder.extract_entities_from_chunks(chunks)
             # Bible context: count extracted entities (e.g., people, places, events)
-            entities_extracted = sum(
-                len(chunk.metadata.get("entities", {}).get("people", []))
-                + len(chunk.metadata.get("entities", {}).get("places", []))
-                + len(chunk.metadata.get("entities", {}).get("events", []))
-                for chunk in chunks
-            )
+            for chunk in chunks:
+                entities = chunk.metadata.get("entities", _NO_ENTITIES)
+                entities_extracted += (
+                    len(entities.get("people", ()))
+                    + len(entities.get("places", ()))
+                    + len(entities.get("events", ()))
+                )
             logger.info(f"Extracted {entities_extracted} Bible entities")
         embedded_chunks = await self.embedder.embed_chunks(chunks)
         logger.info(f"Generated embeddings for {len(embedded_chunks)} chunks")
@@ -243,14 +251,26 @@ class DocumentIngestionPipeline:
             logger.error(f"Documents folder not found: {self.documents_folder}")
             return []
 
-        patterns = ["*.md", "*.markdown", "*.txt"]
+        # Single directory walk (scandir-backed) instead of one recursive glob
+        # per extension; hidden files and directories are skipped like glob does
+        extensions = (".md", ".markdown", ".txt")
         files = []
 
-        for pattern in patterns:
+        # Follow symlinked directories like glob's ** did, skipping any
+        # directory already visited so symlink cycles can't recurse forever
+        visited = set()
+        for root, dirs, filenames in os.walk(self.documents_folder, followlinks=True):
+            real_root = os.path.realpath(root)
+            if real_root in visited:
+                dirs[:] = []
+                continue
+            visited.add(real_root)
+
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
             files.extend(
-                glob.glob(
-                    os.path.join(self.documents_folder, "**", pattern), recursive=True
-                )
+                os.path.join(root, name)
+                for name in filenames
+                if name.endswith(extensions) and not name.startswith(".")
             )
 
         return sorted(files)
@@ -441,6 +461,11 @@ async def main():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile ingestion with cProfile and dump stats to a .pstats file",
+    )
 
     args = parser.parse_args()
 
@@ -470,22 +495,47 @@ async def main():
     try:
         start_time = datetime.now()
 
+        profiler = cProfile.Profile() if args.profile else None
+        if profiler:
+            profiler.enable()
+
         results = await pipeline.ingest_documents(progress_callback)
 
         end_time = datetime.now()
+
+        if profiler:
+            profiler.disable()
+            stats_path = f"profile_ingest_{start_time:%Y%m%d_%H%M%S}.pstats"
+            profiler.dump_stats(stats_path)
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
+            print(f"Profile stats written to {stats_path}")
         total_time = (end_time - start_time).total_seconds()
 
+        # Accumulate all totals in a single pass over the results
+        total_chunks = total_entities = total_episodes = total_errors = 0
+        for result in results:
+            total_chunks += result.chunks_created
+            total_entities += result.entities_extracted
+            total_episodes += result.relationships_created
+            total_errors += len(result.errors)
+
         # Print summary
-        print("\n" + "=" * 50)
-        print("INGESTION SUMMARY")
-        print("=" * 50)
-        print(f"Documents processed: {len(results)}")
-        print(f"Total chunks created: {sum(r.chunks_created for r in results)}")
-        print(f"Total entities extracted: {sum(r.entities_extracted for r in results)}")
-        print(f"Total graph episodes: {sum(r.relationships_created for r in results)}")
-        print(f"Total errors: {sum(len(r.errors) for r in results)}")
-        print(f"Total processing time: {total_time:.2f} seconds")
-        print()
+        rule = "=" * 50
+        print(
+            textwrap.dedent(
+                f"""
+                {rule}
+                INGESTION SUMMARY
+                {rule}
+                Documents processed: {len(results)}
+                Total chunks created: {total_chunks}
+                Total entities extracted: {total_entities}
+                Total graph episodes: {total_episodes}
+                Total errors: {total_errors}
+                Total processing time: {total_time:.2f} seconds
+                """
+            )
+        )
 
         # Print individual results
         for result in results:
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Optional-dependency fallbacks shared by the macro test scripts.
+Uses orjson and uvloop when installed and the stdlib equivalents otherwise.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # Fall back to the stdlib codec when orjson is absent
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+try:
+    from uvloop import run as run_async
+except ImportError:  # Fall back to the stock event loop when uvloop is absent
+    run_async = asyncio.run
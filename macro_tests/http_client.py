@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the macro test scripts.
+Keeps one aiohttp connection pool per process so every caller reuses the same
+keep-alive sockets and DNS cache.
+"""
+
+from typing import Dict, Optional
+
+import aiohttp
+
+# Connection pool settings
+POOL_SIZE = 64
+POOL_SIZE_PER_HOST = 16
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+DEFAULT_TIMEOUT = 60.0
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[aiohttp.ClientTimeout] = None,
+) -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use
+
+    Headers and timeout only apply when the session is created; asking for
+    different ones once it exists raises ValueError instead of ignoring them.
+    """
+    global _session
+    if _session is not None and not _session.closed:
+        if headers is not None and dict(_session.headers) != dict(headers):
+            raise ValueError("Shared session already exists with different headers")
+        if timeout is not None and _session.timeout != timeout:
+            raise ValueError("Shared session already exists with a different timeout")
+        return _session
+
+    connector = aiohttp.TCPConnector(
+        limit=POOL_SIZE,
+        limit_per_host=POOL_SIZE_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    _session = aiohttp.ClientSession(
+        headers=headers,
+        connector=connector,
+        timeout=timeout or aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+    )
+    return _session
+
+
+async def close_session():
+    """Close the shared session and release its pooled connections"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -10,15 +10,23 @@ import asyncio
 import pandas as pd
 from pathlib import Path
 
-# Add the project root directory to Python path
+# Add the project root and this script's directory to Python path
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from backend.services.bible_service import BibleService
 from backend.data_ingestion.embedder import Embedder
 from backend.database.milvus_vector import MilvusManager
 from loguru import logger
 
+from compat import run_async
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text for log output, marking only text that was actually cut"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
 
 async def quick_bible_ingestion():
     """Quick ingestion of sample Bible verses for testing RAG"""
@@ -61,58 +69,71 @@ async def quick_bible_ingestion():
             {"book": "James", "chapter": 2, "verse": 17, "translation": "KJV"},
         ]
 
-        # Get actual verse text from Bible service
+        # Get actual verse text from Bible service, loading each chapter once
+        # and indexing it by verse number for the repeated references
+        chapter_cache = {}
         verses_to_ingest = []
         for verse_ref in sample_verses:
             try:
-                verses = bible_service.get_verses(
-                    verse_ref["translation"], verse_ref["book"], verse_ref["chapter"]
+                chapter_key = (
+                    verse_ref["translation"],
+                    verse_ref["book"],
+                    verse_ref["chapter"],
                 )
-                if verses:
-                    target_verse = next(
-                        (v for v in verses if v["verse"] == verse_ref["verse"]), None
+                if chapter_key not in chapter_cache:
+                    verses = bible_service.get_verses(*chapter_key) or []
+                    chapter_cache[chapter_key] = {v["verse"]: v for v in verses}
+
+                target_verse = chapter_cache[chapter_key].get(verse_ref["verse"])
+                if target_verse:
+                    verses_to_ingest.append(target_verse)
+                    logger.debug(
+                        f"Added {verse_ref['book']} {verse_ref['chapter']}:{verse_ref['verse']}"
                     )
-                    if target_verse:
-                        verses_to_ingest.append(target_verse)
-                        logger.debug(
-                            f"Added {verse_ref['book']} {verse_ref['chapter']}:{verse_ref['verse']}"
-                        )
             except Exception as e:
                 logger.warning(f"Could not get verse {verse_ref}: {e}")
 
         logger.info(f"📖 Collected {len(verses_to_ingest)} verses for ingestion")
 
-        # Process verses and create embeddings
-        ingestion_data = []
-        for i, verse in enumerate(verses_to_ingest):
-            try:
-                # Create verse text for embedding
-                verse_text = f"{verse['book']} {verse['chapter']}:{verse['verse']} - {verse['text']}"
-
-                # Generate embedding
-                embedding = await embedder.embed_text(verse_text)
-                if embedding:
-                    # Prepare data for Milvus
-                    data_point = {
-                        "id": f"verse_{i}",
-                        "vector": embedding,
-                        "text": verse_text,
-                        "translation": "KJV",
-                        "book": verse["book"],
-                        "chapter": verse["chapter"],
-                        "verse": verse["verse"],
-                    }
-                    ingestion_data.append(data_point)
-                    logger.debug(
-                        f"✅ Embedded: {verse['book']} {verse['chapter']}:{verse['verse']}"
-                    )
-                else:
-                    logger.warning(
-                        f"❌ Failed to embed: {verse['book']} {verse['chapter']}:{verse['verse']}"
-                    )
+        # Create verse texts and embed them concurrently instead of one
+        # awaited round-trip per verse
+        verse_texts = [
+            f"{verse['book']} {verse['chapter']}:{verse['verse']} - {verse['text']}"
+            for verse in verses_to_ingest
+        ]
+        embeddings = await asyncio.gather(
+            *(embedder.embed_text(verse_text) for verse_text in verse_texts),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                logger.error(f"Error processing verse {verse}: {e}")
+        # Process verses and their embeddings
+        ingestion_data = []
+        for i, (verse, verse_text, embedding) in enumerate(
+            zip(verses_to_ingest, verse_texts, embeddings)
+        ):
+            if isinstance(embedding, Exception):
+                logger.error(f"Error processing verse {verse}: {embedding}")
+                continue
+
+            if embedding:
+                # Prepare data for Milvus
+                data_point = {
+                    "id": f"verse_{i}",
+                    "vector": embedding,
+                    "text": verse_text,
+                    "translation": "KJV",
+                    "book": verse["book"],
+                    "chapter": verse["chapter"],
+                    "verse": verse["verse"],
+                }
+                ingestion_data.append(data_point)
+                logger.debug(
+                    f"✅ Embedded: {verse['book']} {verse['chapter']}:{verse['verse']}"
+                )
+            else:
+                logger.warning(
+                    f"❌ Failed to embed: {verse['book']} {verse['chapter']}:{verse['verse']}"
+                )
 
         # Insert into Milvus
         if ingestion_data:
@@ -151,7 +172,7 @@ async def quick_bible_ingestion():
                         )
                         for hit in search_results[0]:
                             logger.info(
-                                f"   - {hit.entity.get('text', 'No text')[:100]}..."
+                                f"   - {_truncate(hit.entity.get('text', 'No text'))}"
                             )
                     else:
                         logger.warning("🤔 Search test returned no results")
@@ -187,4 +208,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit(asyncio.run(main()))
+    exit(run_async(main()))
@@ -4,52 +4,168 @@ Comprehensive API Testing Script for BibleStudyAI
 Tests all available endpoints and validates responses.
 """
 
-import requests
-from typing import Dict, Any, Optional
+import asyncio
+import base64
+import json
+import math
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import aiohttp
+
+# Make sibling helpers importable both as a script and via python -m
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from compat import json_dumps, json_loads, run_async
+from http_client import close_session, get_session
 
-# Create note
-note_data = {"title": "Test Note", "content": "This is a test note about John 3:16"}
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 HEADERS = {"Content-Type": "application/json"}
+REQUEST_TIMEOUT = 60.0
+
+# Latency samples (seconds) per endpoint and response status tallies
+TIMINGS: Dict[str, List[float]] = defaultdict(list)
+STATUS_COUNTS: Counter = Counter()
+PERCENTILES = (50, 90, 95, 99)
+
+# Set REUSE_AUTH=1 to reuse a cached token across local reruns
+REUSE_AUTH = os.getenv("REUSE_AUTH") == "1"
+TOKEN_CACHE = Path(__file__).with_name(".test_token.json")
+# Used only when the token carries no readable exp claim; mirrors
+# ACCESS_TOKEN_EXPIRE_MINUTES in backend/auth/security.py
+TOKEN_FALLBACK_TTL = 30 * 60
+
+# Set TEST_VERBOSE=0 for benchmark mode: only the JSON summary line is printed
+VERBOSE = os.getenv("TEST_VERBOSE", "1") == "1"
+
+# Pass/fail tallies for the machine-readable summary
+OUTCOMES: Counter = Counter()
+
+
+def _log(*args, **kwargs):
+    """print() unless running in silent benchmark mode"""
+    if VERBOSE:
+        print(*args, **kwargs)
+
 
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
 
-def make_request(
-    method: str, endpoint: str, data: Optional[Dict] = None
+
+def error_counts() -> tuple:
+    """Return (failed, total) request counts; failures are 4xx/5xx or no response"""
+    total = sum(STATUS_COUNTS.values())
+    errors = sum(
+        count for code, count in STATUS_COUNTS.items() if code is None or code >= 400
+    )
+    return errors, total
+
+
+def print_latency_summary():
+    """Print avg/percentile latency per endpoint plus the overall error rate"""
+    _log("\n" + "=" * 60)
+    _log("LATENCY SUMMARY (ms)")
+    _log("=" * 60)
+
+    header = "".join(f"{'P' + str(p):>8}" for p in PERCENTILES)
+    _log(f"{'Endpoint':<40}{'N':>4}{'Avg':>8}{header}")
+
+    all_samples = []
+    for endpoint, samples in sorted(TIMINGS.items()):
+        all_samples.extend(samples)
+        cells = "".join(f"{percentile(samples, p) * 1000:>8.1f}" for p in PERCENTILES)
+        avg = sum(samples) / len(samples) * 1000
+        _log(f"{endpoint[:39]:<40}{len(samples):>4}{avg:>8.1f}{cells}")
+
+    if all_samples:
+        cells = "".join(
+            f"{percentile(all_samples, p) * 1000:>8.1f}" for p in PERCENTILES
+        )
+        avg = sum(all_samples) / len(all_samples) * 1000
+        _log(f"{'ALL':<40}{len(all_samples):>4}{avg:>8.1f}{cells}")
+
+    errors, total = error_counts()
+    statuses = ", ".join(
+        f"{code}: {count}" for code, count in sorted(STATUS_COUNTS.items(), key=str)
+    )
+    _log(f"\nStatus codes: {statuses}")
+    if total:
+        _log(f"Error rate: {errors / total:.1%} ({errors}/{total})")
+
+
+async def make_request(
+    session: aiohttp.ClientSession,
+    method: str,
+    endpoint: str,
+    data: Optional[Dict] = None,
+    parse_json: bool = True,
+    extra_headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
-    """Make HTTP request and return structured response"""
+    """Make HTTP request and return structured response
+
+    With ``parse_json=False`` only the status line and headers are read; the
+    body is never pulled off the socket (used for HTML pages like /docs).
+    """
     url = f"{BASE_URL}{endpoint}"
 
     try:
+        # Session-level HEADERS are merged with any per-call extras
         if method.upper() == "GET":
-            response = requests.get(url, headers=HEADERS)
+            request = session.get(url, headers=extra_headers)
         elif method.upper() == "POST":
-            response = requests.post(url, headers=HEADERS, json=data)
+            request = session.post(url, headers=extra_headers, json=data)
         elif method.upper() == "PUT":
-            response = requests.put(url, headers=HEADERS, json=data)
+            request = session.put(url, headers=extra_headers, json=data)
         elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=HEADERS)
+            request = session.delete(url, headers=extra_headers)
         else:
             raise ValueError(f"Unsupported method: {method}")
 
-        return {
-            "status_code": response.status_code,
-            "success": response.status_code < 400,
-            "data": response.json() if response.content else None,
-            "headers": dict(response.headers),
-            "url": url,
-        }
-    except requests.exceptions.RequestException as e:
+        start = time.perf_counter()
+        async with request as response:
+            content = await response.read() if parse_json else b""
+            TIMINGS[endpoint].append(time.perf_counter() - start)
+            STATUS_COUNTS[response.status] += 1
+            try:
+                body = json_loads(content) if content else None
+            except ValueError as e:  # JSON, orjson and UTF-8 decode errors
+                return {
+                    "status_code": response.status,
+                    "success": False,
+                    "error": f"JSON decode error: {e}",
+                    "content": content[:200].decode("utf-8", "replace"),
+                    "url": url,
+                }
+
+            return {
+                "status_code": response.status,
+                "success": response.status < 400,
+                "data": body,
+                "headers": dict(response.headers),
+                "url": url,
+            }
+    except aiohttp.ClientError as e:
+        STATUS_COUNTS[None] += 1
         return {"status_code": None, "success": False, "error": str(e), "url": url}
-    except json.JSONDecodeError as e:
-        return {
-            "status_code": response.status_code,
-            "success": False,
-            "error": f"JSON decode error: {e}",
-            "content": response.text[:200],
-            "url": url,
-        }
+    except asyncio.TimeoutError:
+        # aiohttp's total timeout is not a ClientError
+        STATUS_COUNTS[None] += 1
+        error = f"Request timed out after {REQUEST_TIMEOUT}s"
+        return {"status_code": None, "success": False, "error": error, "url": url}
+
+
+def _preview(obj: Any, n: int = 100) -> str:
+    """Short JSON rendering of a response payload for log output"""
+    return json_dumps(obj)[:n].decode("utf-8", "ignore")
 
 
 def print_test_result(
@@ -60,87 +176,132 @@ def print_test_result(
         result.get("success", False) and result.get("status_code") == expected_status
     )
     status = "✅ PASS" if success else "❌ FAIL"
+    OUTCOMES["passed" if success else "failed"] += 1
 
-    print(f"\n{status} {test_name}")
-    print(f"   URL: {result['url']}")
-    print(f"   Status: {result.get('status_code', 'N/A')}")
+    # Build the block first and emit it with a single write
+    lines = [
+        f"\n{status} {test_name}",
+        f"   URL: {result['url']}",
+        f"   Status: {result.get('status_code', 'N/A')}",
+    ]
 
     if not success:
         if "error" in result:
-            print(f"   Error: {result['error']}")
+            lines.append(f"   Error: {result['error']}")
         if "content" in result:
-            print(f"   Content: {result['content']}")
+            lines.append(f"   Content: {result['content']}")
 
     if success and result.get("data"):
         if isinstance(result["data"], list):
-            print(f"   Response: List with {len(result['data'])} items")
+            lines.append(f"   Response: List with {len(result['data'])} items")
             if result["data"]:
-                print(f"   Sample: {str(result['data'][0])[:100]}...")
+                lines.append(f"   Sample: {_preview(result['data'][0])}...")
         elif isinstance(result["data"], dict):
-            print(f"   Response: {str(result['data'])[:100]}...")
+            lines.append(f"   Response: {_preview(result['data'])}...")
         else:
-            print(f"   Response: {result['data']}")
+            lines.append(f"   Response: {result['data']}")
+
+    _log("\n".join(lines))
+
+
+BASIC_TESTS = [
+    ("Root endpoint", "/"),
+    ("Health check", "/health"),
+    ("API Documentation", "/docs"),
+]
+
+# Endpoints serving HTML rather than JSON; only their status is checked
+RAW_ENDPOINTS = frozenset({"/docs"})
+
+BIBLE_TESTS = [
+    ("Get Bible translations", "/api/bible/translations"),
+    ("Get books for KJV", "/api/bible/KJV/books"),
+    ("Get chapters for John (KJV)", "/api/bible/KJV/John/chapters"),
+    ("Get John 3 verses (KJV)", "/api/bible/KJV/John/3/verses"),
+    ("Search for 'love' in KJV", "/api/bible/KJV/search?query=love"),
+    ("Get Psalm 23 verses (ESV)", "/api/bible/ESV/Psalms/23/verses"),
+]
+
+
+async def run_get_tests(session: aiohttp.ClientSession, title: str, tests) -> None:
+    """Issue independent GET probes concurrently and report them in table order"""
+    results = await asyncio.gather(
+        *(
+            make_request(
+                session, "GET", endpoint, parse_json=endpoint not in RAW_ENDPOINTS
+            )
+            for _, endpoint in tests
+        )
+    )
 
+    # Report once all results are in so concurrent groups don't interleave
+    _log("\n" + "=" * 60)
+    _log(title)
+    _log("=" * 60)
 
-def test_basic_endpoints():
-    """Test basic API endpoints"""
-    print("=" * 60)
-    print("TESTING BASIC ENDPOINTS")
-    print("=" * 60)
+    for (name, _), result in zip(tests, results):
+        print_test_result(name, result)
 
-    # Root endpoint
-    result = make_request("GET", "/")
-    print_test_result("Root endpoint", result)
 
-    # Health check
-    result = make_request("GET", "/health")
-    print_test_result("Health check", result)
-
-    # API docs
-    result = make_request("GET", "/docs")
-    print_test_result("API Documentation", result)
+async def check_basic_endpoints(session: aiohttp.ClientSession):
+    """Test basic API endpoints"""
+    await run_get_tests(session, "TESTING BASIC ENDPOINTS", BASIC_TESTS)
 
 
-def test_bible_endpoints():
+async def check_bible_endpoints(session: aiohttp.ClientSession):
     """Test Bible service endpoints"""
-    print("\n" + "=" * 60)
-    print("TESTING BIBLE ENDPOINTS")
-    print("=" * 60)
+    await run_get_tests(session, "TESTING BIBLE ENDPOINTS", BIBLE_TESTS)
 
-    # Get translations
-    result = make_request("GET", "/api/bible/translations")
-    print_test_result("Get Bible translations", result)
 
-    # Get books for a translation
-    result = make_request("GET", "/api/bible/KJV/books")
-    print_test_result("Get books for KJV", result)
+async def load_cached_token(session: aiohttp.ClientSession) -> Optional[str]:
+    """Return the cached token if it is unexpired and still accepted by the API"""
+    try:
+        token_data = json_loads(TOKEN_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    token = token_data.get("access_token")
+    if not token or token_data.get("exp", 0) <= time.time():
+        return None
 
-    # Get chapters for a book
-    result = make_request("GET", "/api/bible/KJV/John/chapters")
-    print_test_result("Get chapters for John (KJV)", result)
+    # Cheap authenticated probe to confirm the server still accepts the token
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        async with session.get(f"{BASE_URL}/api/notes/", headers=headers) as response:
+            return token if response.status < 400 else None
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
 
-    # Get verses for a chapter
-    result = make_request("GET", "/api/bible/KJV/John/3/verses")
-    print_test_result("Get John 3 verses (KJV)", result)
 
-    # Search verses
-    result = make_request("GET", "/api/bible/KJV/search?query=love")
-    print_test_result("Search for 'love' in KJV", result)
+def token_expiry(token: str) -> float:
+    """Expiry timestamp from the JWT's own exp claim (signature not verified)"""
+    try:
+        claims = token.split(".")[1]
+        padded = claims + "=" * (-len(claims) % 4)
+        return float(json_loads(base64.urlsafe_b64decode(padded))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + TOKEN_FALLBACK_TTL
+
 
-    # Test with different translation
-    result = make_request("GET", "/api/bible/ESV/Psalms/23/verses")
-    print_test_result("Get Psalm 23 verses (ESV)", result)
+def save_cached_token(token: str):
+    """Persist the token so REUSE_AUTH reruns can skip register and login"""
+    payload = {"access_token": token, "exp": token_expiry(token)}
+    TOKEN_CACHE.write_text(json.dumps(payload))
 
 
-def test_auth_endpoints():
+async def check_auth_endpoints(session: aiohttp.ClientSession):
     """Test authentication endpoints"""
-    print("\n" + "=" * 60)
-    print("TESTING AUTH ENDPOINTS")
-    print("=" * 60)
+    _log("\n" + "=" * 60)
+    _log("TESTING AUTH ENDPOINTS")
+    _log("=" * 60)
 
-    # Use timestamp to ensure unique email
-    import time
+    if REUSE_AUTH:
+        token = await load_cached_token(session)
+        if token:
+            _log(f"\n   Reusing cached token from {TOKEN_CACHE.name}: {token[:20]}...")
+            return token
 
+    # Use timestamp to ensure unique email
     timestamp = int(time.time())
     unique_email = f"test{timestamp}@example.com"
 
@@ -150,7 +311,7 @@ def test_auth_endpoints():
         "name": f"Test User {timestamp}",
         "password": "testpassword123",
     }
-    result = make_request("POST", "/auth/register", user_data)
+    result = await make_request(session, "POST", "/auth/register", user_data)
     print_test_result("Register user", result, 201)
 
     # Login
@@ -159,7 +320,7 @@ def test_auth_endpoints():
         "name": f"Test User {timestamp}",  # Required by UserCreate model
         "password": "testpassword123",
     }
-    result = make_request("POST", "/auth/login", login_data)
+    result = await make_request(session, "POST", "/auth/login", login_data)
     print_test_result("Login user", result)
 
     # Extract token for authenticated requests
@@ -167,20 +328,22 @@ def test_auth_endpoints():
     if result.get("success") and result.get("data"):
         token = result["data"].get("access_token")
         if token:
-            print(f"   Token obtained: {token[:20]}...")
+            _log(f"   Token obtained: {token[:20]}...")
+            if REUSE_AUTH:
+                save_cached_token(token)
 
     return token
 
 
-def test_notes_endpoints(token: Optional[str] = None):
+async def check_notes_endpoints(
+    session: aiohttp.ClientSession, token: Optional[str] = None
+):
     """Test notes endpoints"""
-    print("\n" + "=" * 60)
-    print("TESTING NOTES ENDPOINTS")
-    print("=" * 60)
+    _log("\n" + "=" * 60)
+    _log("TESTING NOTES ENDPOINTS")
+    _log("=" * 60)
 
-    auth_headers = HEADERS.copy()
-    if token:
-        auth_headers["Authorization"] = f"Bearer {token}"
+    auth_headers = {"Authorization": f"Bearer {token}"} if token else None
 
     # Create note
     note_data = {
@@ -188,82 +351,91 @@ def test_notes_endpoints(token: Optional[str] = None):
         "content": "This is a test note about John 3:16",
         "reference": "John 3:16",
     }
+    result = await make_request(
+        session, "POST", "/api/notes/", note_data, extra_headers=auth_headers
+    )
+    print_test_result("Create note", result, 201)
 
-    try:
-        url = f"{BASE_URL}/api/notes/"
-        response = requests.post(url, headers=auth_headers, json=note_data)
-        result = {
-            "status_code": response.status_code,
-            "success": response.status_code < 400,
-            "data": response.json() if response.content else None,
-            "url": url,
-        }
-        print_test_result("Create note", result, 201)
-
-        # Get notes
-        response = requests.get(f"{BASE_URL}/api/notes/", headers=auth_headers)
-        result = {
-            "status_code": response.status_code,
-            "success": response.status_code < 400,
-            "data": response.json() if response.content else None,
-            "url": f"{BASE_URL}/api/notes/",
-        }
-        print_test_result("Get notes", result)
-
-    except Exception as e:
-        print(f"❌ FAIL Notes endpoints: {e}")
-
-
-def test_chat_endpoints():
-    """Test chat/RAG endpoints"""
-    print("\n" + "=" * 60)
-    print("TESTING CHAT/RAG ENDPOINTS")
-    print("=" * 60)
+    # Get notes
+    result = await make_request(
+        session, "GET", "/api/notes/", extra_headers=auth_headers
+    )
+    print_test_result("Get notes", result)
 
+
+async def check_chat_endpoints(session: aiohttp.ClientSession):
+    """Test chat/RAG endpoints"""
     # Test RAG endpoint (available)
     query_data = {"question": "What does the Bible say about love?"}
-    result = make_request("POST", "/api/rag/answer", query_data)
+    result = await make_request(session, "POST", "/api/rag/answer", query_data)
+
+    _log("\n" + "=" * 60)
+    _log("TESTING CHAT/RAG ENDPOINTS")
+    _log("=" * 60)
+
     print_test_result("RAG Query about love", result)
 
     # Note: Other chat endpoints are commented out in main.py, so they'll return 404
-    print("   Note: Other chat endpoints (/api/chat/*) are disabled in main.py")
+    _log("   Note: Other chat endpoints (/api/chat/*) are disabled in main.py")
 
 
 def test_search_endpoints():
     """Test search-related endpoints"""
-    print("\n" + "=" * 60)
-    print("TESTING SEARCH ENDPOINTS")
-    print("=" * 60)
+    _log("\n" + "=" * 60)
+    _log("TESTING SEARCH ENDPOINTS")
+    _log("=" * 60)
 
-    print("   Note: Search endpoints (/api/chat/*) are disabled in main.py")
-    print("   Only /api/rag/answer is currently available for AI queries")
+    _log("   Note: Search endpoints (/api/chat/*) are disabled in main.py")
+    _log("   Only /api/rag/answer is currently available for AI queries")
 
 
-def main():
+async def main():
     """Run all tests"""
-    print("🚀 Starting BibleStudyAI API Testing Suite")
-    print(f"Base URL: {BASE_URL}")
-
-    # Test basic functionality
-    test_basic_endpoints()
-    test_bible_endpoints()
+    start = time.perf_counter()
+    _log("🚀 Starting BibleStudyAI API Testing Suite")
+    _log(f"Base URL: {BASE_URL}")
 
-    # Test authentication and get token
-    token = test_auth_endpoints()
+    session = get_session(HEADERS, aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+    try:
+        # Basic, Bible and chat/RAG groups are independent of each other
+        await asyncio.gather(
+            check_basic_endpoints(session),
+            check_bible_endpoints(session),
+            check_chat_endpoints(session),
+        )
 
-    # Test notes with auth token
-    test_notes_endpoints(token)
+        # Test authentication and get token
+        token = await check_auth_endpoints(session)
 
-    # Test chat/RAG functionality
-    test_chat_endpoints()
+        # Test notes with auth token
+        await check_notes_endpoints(session, token)
+    finally:
+        await close_session()
 
     # Test search functionality
     test_search_endpoints()
 
-    print("\n" + "=" * 60)
-    print("✅ API Testing Complete!")
-    print("=" * 60)
+    print_latency_summary()
+
+    _log("\n" + "=" * 60)
+    _log("✅ API Testing Complete!")
+    _log("=" * 60)
+
+    # Always emit one machine-readable line for benchmark consumers
+    samples = [sample for values in TIMINGS.values() for sample in values]
+    errors, total = error_counts()
+    summary = {
+        "passed": OUTCOMES["passed"],
+        "failed": OUTCOMES["failed"],
+        "requests": total,
+        "error_rate": errors / total if total else 0.0,
+        "wall_time_s": round(time.perf_counter() - start, 4),
+    }
+    if samples:
+        for pct in PERCENTILES:
+            summary[f"p{pct}_ms"] = round(percentile(samples, pct) * 1000, 2)
+    print(json.dumps(summary))
 
 
 if __name__ == "__main__":
-    main()
+    run_async(main())
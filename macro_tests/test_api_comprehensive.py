@@ -4,50 +4,72 @@ Comprehensive API Testing Script for BibleStudyAI
 Tests all available endpoints and validates responses.
 """
 
-import requests
-import json
+import asyncio
+import sys
 import time
+from pathlib import Path
 from typing import Dict, Any, Optional
 
+import httpx
+
+# Make sibling helpers importable both as a script and via python -m
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from compat import json_dumps, json_loads, run_async
+
+
 # Configuration
 BASE_URL = "http://localhost:8000"
 HEADERS = {"Content-Type": "application/json"}
+REQUEST_TIMEOUT = 60.0
+
+# Client method per HTTP verb; only POST and PUT send a JSON body
+CLIENT_METHODS = {
+    "GET": httpx.AsyncClient.get,
+    "POST": httpx.AsyncClient.post,
+    "PUT": httpx.AsyncClient.put,
+    "DELETE": httpx.AsyncClient.delete,
+}
+BODY_METHODS = frozenset({"POST", "PUT"})
+
 
+# Endpoints serving HTML rather than JSON; only their status is checked
+RAW_ENDPOINTS = frozenset({"/docs"})
 
-def make_request(
+
+async def make_request(
+    client: httpx.AsyncClient,
     method: str,
     endpoint: str,
     data: Optional[Dict] = None,
     headers: Optional[Dict] = None,
 ) -> Dict[str, Any]:
-    """Make HTTP request and return structured response"""
+    """Make HTTP request and return structured response
+
+    Bodies of RAW_ENDPOINTS are not decoded; for every other endpoint a body
+    that isn't valid JSON fails the request.
+    """
     url = f"{BASE_URL}{endpoint}"
-    request_headers = HEADERS.copy()
-    if headers:
-        request_headers.update(headers)
 
-    try:
-        if method.upper() == "GET":
-            response = requests.get(url, headers=request_headers)
-        elif method.upper() == "POST":
-            response = requests.post(url, headers=request_headers, json=data)
-        elif method.upper() == "PUT":
-            response = requests.put(url, headers=request_headers, json=data)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=request_headers)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
+    method = method.upper()
+    send = CLIENT_METHODS.get(method)
+    if send is None:
+        raise ValueError(f"Unsupported method: {method}")
 
-        return {
-            "status_code": response.status_code,
-            "success": response.status_code < 400,
-            "data": response.json() if response.content else None,
-            "headers": dict(response.headers),
-            "url": url,
-        }
-    except requests.exceptions.RequestException as e:
+    # Client headers already carry HEADERS; only per-call extras are passed
+    kwargs: Dict[str, Any] = {"headers": headers}
+    if method in BODY_METHODS and data is not None:
+        kwargs["content"] = json_dumps(data)
+
+    try:
+        response = await send(client, url, **kwargs)
+    except httpx.HTTPError as e:
         return {"status_code": None, "success": False, "error": str(e), "url": url}
-    except json.JSONDecodeError as e:
+
+    parse_json = endpoint not in RAW_ENDPOINTS
+    try:
+        body = json_loads(response.content) if parse_json and response.content else None
+    except ValueError as e:  # JSON, orjson and UTF-8 decode errors
         return {
             "status_code": response.status_code,
             "success": False,
@@ -56,6 +78,14 @@ def make_request(
             "url": url,
         }
 
+    return {
+        "status_code": response.status_code,
+        "success": response.status_code < 400,
+        "data": body,
+        "headers": dict(response.headers),
+        "url": url,
+    }
+
 
 def print_test_result(
     test_name: str, result: Dict[str, Any], expected_status: int = 200
@@ -87,57 +117,50 @@ def print_test_result(
             print(f"   Response: {result['data']}")
 
 
-def test_basic_endpoints():
+async def check_basic_endpoints(client: httpx.AsyncClient):
     """Test basic API endpoints"""
+    # Independent probes run concurrently; results print once all are in so
+    # sections from concurrently running groups don't interleave
+    root, health, docs = await asyncio.gather(
+        make_request(client, "GET", "/"),
+        make_request(client, "GET", "/health"),
+        make_request(client, "GET", "/docs"),
+    )
+
     print("=" * 60)
     print("TESTING BASIC ENDPOINTS")
     print("=" * 60)
 
-    # Root endpoint
-    result = make_request("GET", "/")
-    print_test_result("Root endpoint", result)
+    print_test_result("Root endpoint", root)
+    print_test_result("Health check", health)
+    print_test_result("API Documentation", docs)
 
-    # Health check
-    result = make_request("GET", "/health")
-    print_test_result("Health check", result)
 
-    # API docs
-    result = make_request("GET", "/docs")
-    print_test_result("API Documentation", result)
+BIBLE_TESTS = [
+    ("Get Bible translations", "/api/bible/translations"),
+    ("Get books for KJV", "/api/bible/KJV/books"),
+    ("Get chapters for John (KJV)", "/api/bible/KJV/John/chapters"),
+    ("Get John 3 verses (KJV)", "/api/bible/KJV/John/3/verses"),
+    ("Search for 'love' in KJV", "/api/bible/KJV/search?query=love"),
+    ("Get Psalm 23 verses (ESV)", "/api/bible/ESV/Psalms/23/verses"),
+]
 
 
-def test_bible_endpoints():
+async def check_bible_endpoints(client: httpx.AsyncClient):
     """Test Bible service endpoints"""
+    results = await asyncio.gather(
+        *(make_request(client, "GET", endpoint) for _, endpoint in BIBLE_TESTS)
+    )
+
     print("\n" + "=" * 60)
     print("TESTING BIBLE ENDPOINTS")
     print("=" * 60)
 
-    # Get translations
-    result = make_request("GET", "/api/bible/translations")
-    print_test_result("Get Bible translations", result)
-
-    # Get books for a translation
-    result = make_request("GET", "/api/bible/KJV/books")
-    print_test_result("Get books for KJV", result)
-
-    # Get chapters for a book
-    result = make_request("GET", "/api/bible/KJV/John/chapters")
-    print_test_result("Get chapters for John (KJV)", result)
+    for (test_name, _), result in zip(BIBLE_TESTS, results):
+        print_test_result(test_name, result)
 
-    # Get verses for a chapter
-    result = make_request("GET", "/api/bible/KJV/John/3/verses")
-    print_test_result("Get John 3 verses (KJV)", result)
 
-    # Search verses
-    result = make_request("GET", "/api/bible/KJV/search?query=love")
-    print_test_result("Search for 'love' in KJV", result)
-
-    # Test with different translation
-    result = make_request("GET", "/api/bible/ESV/Psalms/23/verses")
-    print_test_result("Get Psalm 23 verses (ESV)", result)
-
-
-def test_auth_endpoints():
+async def check_auth_endpoints(client: httpx.AsyncClient):
     """Test authentication endpoints"""
     print("\n" + "=" * 60)
     print("TESTING AUTH ENDPOINTS")
@@ -152,7 +175,7 @@ def test_auth_endpoints():
         "name": "Test User",
         "password": "testpassword123",
     }
-    result = make_request("POST", "/auth/register", user_data)
+    result = await make_request(client, "POST", "/auth/register", user_data)
     print_test_result("Register user", result, 201)
 
     # Login
@@ -161,7 +184,7 @@ def test_auth_endpoints():
         "name": "Test User",
         "password": "testpassword123",
     }
-    result = make_request("POST", "/auth/login", login_data)
+    result = await make_request(client, "POST", "/auth/login", login_data)
     print_test_result("Login user", result)
 
     # Extract token for authenticated requests
@@ -174,7 +197,7 @@ def test_auth_endpoints():
     return token
 
 
-def test_notes_endpoints(token: Optional[str] = None):
+async def check_notes_endpoints(client: httpx.AsyncClient, token: Optional[str] = None):
     """Test notes endpoints"""
     print("\n" + "=" * 60)
     print("TESTING NOTES ENDPOINTS")
@@ -192,65 +215,78 @@ def test_notes_endpoints(token: Optional[str] = None):
         "content": "This is a test note about John 3:16",
         "reference": "John 3:16",
     }
-    result = make_request("POST", "/api/notes/", data=note_data, headers=auth_headers)
+    result = await make_request(
+        client, "POST", "/api/notes/", data=note_data, headers=auth_headers
+    )
     print_test_result("Create note", result, 201)
-    note_id = result.get("data", {}).get("id") if result.get("success") else None
+    note_id = (result.get("data") or {}).get("id") if result.get("success") else None
 
     # Get notes
-    result = make_request("GET", "/api/notes/", headers=auth_headers)
+    result = await make_request(client, "GET", "/api/notes/", headers=auth_headers)
     print_test_result("Get notes", result)
 
     if note_id:
         # Get single note
-        result = make_request("GET", f"/api/notes/{note_id}", headers=auth_headers)
+        result = await make_request(
+            client, "GET", f"/api/notes/{note_id}", headers=auth_headers
+        )
         print_test_result("Get single note", result)
 
         # Update note
         update_data = {"content": "Updated content for the test note."}
-        result = make_request(
-            "PUT", f"/api/notes/{note_id}", data=update_data, headers=auth_headers
+        result = await make_request(
+            client,
+            "PUT",
+            f"/api/notes/{note_id}",
+            data=update_data,
+            headers=auth_headers,
         )
         print_test_result("Update note", result)
 
         # Delete note
-        result = make_request("DELETE", f"/api/notes/{note_id}", headers=auth_headers)
+        result = await make_request(
+            client, "DELETE", f"/api/notes/{note_id}", headers=auth_headers
+        )
         print_test_result("Delete note", result, 204)
 
 
-def test_chat_endpoints():
+async def check_chat_endpoints(client: httpx.AsyncClient):
     """Test chat/RAG endpoints"""
+    query_data = {"question": "What does the Bible say about love?"}
+    kg_query_data = {"query": "MATCH (b:Book {name: 'John'}) RETURN b.name"}
+    rag_result, kg_result = await asyncio.gather(
+        # Test RAG endpoint
+        make_request(client, "POST", "/api/rag/answer", query_data),
+        # Test knowledge graph query
+        make_request(client, "POST", "/api/chat/kg", kg_query_data),
+    )
+
     print("\n" + "=" * 60)
     print("TESTING CHAT/RAG ENDPOINTS")
     print("=" * 60)
 
-    # Test RAG endpoint
-    query_data = {"question": "What does the Bible say about love?"}
-    result = make_request("POST", "/api/rag/answer", query_data)
-    print_test_result("RAG Query about love", result)
-
-    # Test knowledge graph query
-    kg_query_data = {"query": "MATCH (b:Book {name: 'John'}) RETURN b.name"}
-    result = make_request("POST", "/api/chat/kg", kg_query_data)
-    print_test_result("Knowledge Graph Query", result)
+    print_test_result("RAG Query about love", rag_result)
+    print_test_result("Knowledge Graph Query", kg_result)
 
 
-def main():
+async def main():
     """Run all tests"""
     print("🚀 Starting BibleStudyAI API Testing Suite")
     print(f"Base URL: {BASE_URL}")
 
-    # Test basic functionality
-    test_basic_endpoints()
-    test_bible_endpoints()
-
-    # Test authentication and get token
-    token = test_auth_endpoints()
+    async with httpx.AsyncClient(headers=HEADERS, timeout=REQUEST_TIMEOUT) as client:
+        # Basic, Bible and chat endpoints have no ordering dependency
+        await asyncio.gather(
+            check_basic_endpoints(client),
+            check_bible_endpoints(client),
+            check_chat_endpoints(client),
+        )
 
-    # Test notes with auth token
-    test_notes_endpoints(token)
+        # Test authentication and get token
+        token = await check_auth_endpoints(client)
 
-    # Test chat/RAG functionality
-    test_chat_endpoints()
+        # Test notes with auth token
+        await check_notes_endpoints(client, token)
 
     print("\n" + "=" * 60)
     print("✅ API Testing Complete!")
@@ -258,4 +294,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_async(main())